@@ -1,288 +1,509 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-import time
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+import multiprocessing
+import multiprocessing.util
 import os
+import time
+import shutil
 import requests
 import re
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
 
 # Main output directory
 os.makedirs('scraped_products', exist_ok=True)
 
+# Listing page with all products loaded
+LISTING_URL = "https://www.la-z-boy.com/b/living-room-recliners/_/N-musa9i?intpromo=header.Recliner#/b/living-room-recliners/_/N-musa9i?intpromo=header.Recliner&No=213&Nrpp=36&plpaction=loadmore"
+
+# Number of Chrome worker processes scraping products in parallel
+SCRAPE_WORKERS = 4
+
+# Number of parallel image download workers
+DOWNLOAD_WORKERS = 16
+
+# Flush the combined CSV to disk every this many products
+CSV_FLUSH_EVERY = 50
+
+# URL patterns Chrome should never fetch - the scraper only reads DOM text
+# and image URLs, so fonts and trackers are wasted bandwidth. CSS is left
+# alone because swatch visibility (and thus clickability) depends on it.
+BLOCKED_URL_PATTERNS = [
+    '*.woff',
+    '*.woff2',
+    '*.ttf',
+    '*google-analytics*',
+    '*googletagmanager*',
+    '*doubleclick*',
+]
+
+# CSS selectors for the WebDriver lookups that remain outside the JS batch
+# extraction (which mirrors the same class names)
+TILE_SELECTOR = '.product-tile'
+SWATCH_BUTTON_SELECTOR = '.cover-swatch-list button'
+TILE_IMG_SELECTOR = '.img-wrapper img'
+
+# JavaScript that collects every tile's metadata in a single WebDriver call
+# instead of ~7 find_element round-trips per tile
+EXTRACT_TILES_JS = """
+return Array.from(document.querySelectorAll('.product-tile')).map(function (tile) {
+    var name = tile.querySelector('.product-name');
+    var img = tile.querySelector('.img-wrapper img');
+    var detail = tile.querySelector('.item-detail');
+    var pricing = tile.querySelector('.item-pricing');
+    return {
+        name: name ? name.innerText.trim() : '',
+        image_url: img ? (img.getAttribute('src') || img.getAttribute('data-src')) : null,
+        detail: detail ? detail.innerText : '',
+        pricing: pricing ? pricing.innerText : '',
+        swatch_count: tile.querySelectorAll('.cover-swatch-list button').length
+    };
+});
+"""
+
+# Per-worker WebDriver instance, created by _init_worker (WebDriver is
+# process-safe but not thread-safe, so each pool worker owns its own Chrome)
+_worker_driver = None
+
+# Deletion table for characters that are invalid in folder names
+_BAD_CHARS = dict.fromkeys(map(ord, '<>:"/\\|?*'), None)
+
+# Collapses runs of whitespace to a single space
+_WS_RE = re.compile(r'\s+')
+
+# Matches one line of a detail/pricing block, capturing an optional "key:"
+# prefix and the (possibly empty) value; findall parses a whole block in
+# one pass. The value side must tolerate empty so a colon-terminated line
+# like "Assembly Required:" still parses as a key with an empty value.
+_LINE_RE = re.compile(r'^[ \t]*(?:([^:\n]+?)[ \t]*:)?[ \t]*([^\n]*?)[ \t]*$', re.M)
+
+def _parse_block(product_name, text, label):
+    """Parse a detail/pricing text block into (product_name, field, value) rows.
+
+    Lines with a colon become key/value pairs; lines without one get a
+    numbered label ("Price 1", "Detail 2", ...) like before. The block is
+    stripped first so numbering starts at the first non-blank line, as the
+    baseline did; interior blank lines match as empty pairs and are
+    skipped here.
+    """
+    rows = []
+    for i, (key, value) in enumerate(_LINE_RE.findall(text.strip()), 1):
+        if key or value:
+            rows.append((product_name, key if key else f'{label} {i}', value))
+    return rows
+
 def sanitize_folder_name(name):
     """Sanitize product name to create a valid folder name"""
-    # Remove or replace invalid characters for folder names
-    name = re.sub(r'[<>:"/\\|?*]', '', name)
-    # Replace multiple spaces with single space
-    name = re.sub(r'\s+', ' ', name)
-    # Remove leading/trailing spaces
-    name = name.strip()
-    # Limit length to avoid issues with long paths
-    if len(name) > 100:
-        name = name[:100]
-    return name
-
-def download_image(image_url, filename):
+    # Strip invalid characters in one C-level translate pass
+    name = name.translate(_BAD_CHARS)
+    # Collapse whitespace runs and trim; limit length for long paths
+    name = _WS_RE.sub(' ', name).strip()
+    return name[:100]
+
+def build_session():
+    """Create a requests Session with a keep-alive connection pool and retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Be explicit that pooled connections should be reused across requests
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+def _best_src(driver, element):
+    """Read an image element's src, falling back to data-src, in one round-trip"""
+    return driver.execute_script(
+        'return arguments[0].getAttribute("src") || arguments[0].getAttribute("data-src");',
+        element,
+    )
+
+def download_image(session, image_url, filename):
     """Download image from URL and save it locally"""
+    # Skip files already on disk from a previous run so re-runs after a
+    # crash only fetch what is missing
+    if os.path.exists(filename) and os.path.getsize(filename) > 0:
+        print(f"✓ Already exists, skipping: {filename}")
+        return True
     try:
-        response = requests.get(image_url, timeout=10)
-        if response.status_code == 200:
-            with open(filename, 'wb') as f:
-                f.write(response.content)
-            print(f"✓ Downloaded: {filename}")
-            return True
+        with session.get(image_url, timeout=10, stream=True) as response:
+            if response.status_code == 200:
+                # Stream straight to disk in 64KB chunks - constant memory
+                # per download instead of materializing the whole image
+                response.raw.decode_content = True
+                with open(filename, 'wb', buffering=1 << 16) as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 16)
+                print(f"✓ Downloaded: {filename}")
+                return True
     except Exception as e:
         print(f"✗ Failed to download {filename}: {str(e)}")
     return False
 
-def setup_driver():
+def setup_driver(headless=True):
     """Setup Chrome WebDriver with options"""
     options = webdriver.ChromeOptions()
-    # Uncomment the line below to run in headless mode
-    # options.add_argument('--headless')
+    if headless:
+        options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+    # Don't render images in the browser; their src attributes still update
+    # in the DOM and the actual bytes are fetched separately with requests
+    options.add_argument('--blink-settings=imagesEnabled=false')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--start-maximized')
-    
+
     driver = webdriver.Chrome(options=options)
+
+    # Block fonts and trackers at the network layer
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
     return driver
 
+def _wait_for_tiles(driver, target, timeout=30, settle=2.0):
+    """Wait for the async loadmore grid to contain at least `target` tiles.
+
+    The listing fills in batches after the initial render, so presence of
+    the first tile doesn't mean the grid is complete. Returns the tile
+    count once it reaches `target`, or once it has stopped growing for
+    `settle` seconds (shorter listings). Raises TimeoutException if no
+    tiles appear at all within `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    count = 0
+    last_change = time.monotonic()
+    while True:
+        new_count = len(driver.find_elements(By.CSS_SELECTOR, TILE_SELECTOR))
+        if new_count != count:
+            count = new_count
+            last_change = time.monotonic()
+        if count >= target:
+            return count
+        now = time.monotonic()
+        if count and now - last_change >= settle:
+            return count
+        if now >= deadline:
+            if count:
+                return count
+            raise TimeoutException(f"No product tiles appeared within {timeout}s")
+        time.sleep(0.1)
+
+def _init_worker():
+    """Give each pool worker its own headless Chrome, loaded on the listing page.
+
+    Never raises: an initializer that dies makes the Pool respawn
+    replacement workers in an endless launch-and-crash loop without
+    surfacing anything to the parent. On failure the worker keeps running
+    with no driver and scrape_product skips the swatch step.
+    """
+    global _worker_driver
+    driver = None
+    try:
+        driver = setup_driver(headless=True)
+        driver.get(LISTING_URL)
+        _wait_for_tiles(driver, 1, timeout=15)
+    except Exception as e:
+        print(f"✗ Worker browser setup failed ({str(e)}) - swatch extraction disabled in this worker")
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        _worker_driver = None
+        return
+
+    _worker_driver = driver
+    # Pool children exit via os._exit, which skips atexit handlers, but
+    # multiprocessing's own exit function does run registered finalizers -
+    # this is what actually shuts Chrome down when the pool closes
+    multiprocessing.util.Finalize(None, driver.quit, exitpriority=0)
+
+def scrape_product(task):
+    """Scrape one product tile (runs inside a pool worker).
+
+    Takes a (1-based index, tile metadata dict) pair and returns the
+    (product_name, field, value) CSV rows and the (image_url, filename)
+    download tasks collected for this product.
+    """
+    index, data = task
+    driver = _worker_driver
+    csv_rows = []
+    download_tasks = []
+
+    print(f"{'='*60}")
+    print(f"Processing Product #{index}")
+    print(f"{'='*60}")
+
+    # Name, main image and details all come from the phase-1 metadata, so
+    # collect them up front - a browser failure in the swatch step below
+    # must not cost us the rows and downloads that need no browser at all.
+
+    # ===== EXTRACT PRODUCT NAME FIRST =====
+    print("\n[EXTRACTING PRODUCT NAME]")
+    product_name = data['name']
+
+    if not product_name:
+        product_name = f"Product_{index}"
+        print(f"⚠ Product name is empty, using default: {product_name}")
+    else:
+        print(f"✓ Product Name: {product_name}")
+
+    # Product-specific folder (already created by the pre-pass in main)
+    folder_name = sanitize_folder_name(product_name)
+    product_folder = os.path.join('scraped_products', folder_name)
+
+    # ===== STEP #01: Extract main image =====
+    print("\n[STEP 1] Extracting main product image...")
+    main_image_url = data['image_url']
+
+    if main_image_url:
+        main_image_filename = os.path.join(product_folder, "main_image.jpg")
+        download_tasks.append((main_image_url, main_image_filename))
+        print(f"✓ Queued main image for download")
+    else:
+        print("✗ Main image URL not found")
+
+    # ===== STEP #02: Extract product details to CSV rows =====
+    print("\n[STEP 2] Extracting product details...")
+    detail_text = data['detail']
+    pricing_text = data['pricing']
+
+    if pricing_text:
+        print(f"✓ Found pricing information")
+    else:
+        print("⚠ No pricing information found for this product")
+
+    if detail_text:
+        # Parse each text block into structured rows with one regex pass
+        if pricing_text.strip():
+            csv_rows.append((product_name, '=== PRICING ===', ''))
+            csv_rows.extend(_parse_block(product_name, pricing_text, 'Price'))
+
+        csv_rows.append((product_name, '=== DETAILS ===', ''))
+        csv_rows.extend(_parse_block(product_name, detail_text, 'Detail'))
+
+        print(f"✓ Collected {len(csv_rows)} detail row(s)")
+    else:
+        print("✗ Could not find item-detail element")
+
+    # ===== STEP #03: Click color swatches and extract images =====
+    # The only browser-dependent step, so it is the only one a WebDriver
+    # failure can take down.
+    try:
+        print("\n[STEP 3] Processing color swatches...")
+        if driver is None:
+            print("⚠ No browser in this worker - skipping swatch extraction")
+        elif data['swatch_count']:
+            # This worker's page fills via the same async loadmore, so tile
+            # `index` may not exist yet even though the initializer saw the
+            # first batch; wait for it instead of indexing blindly
+            loaded = _wait_for_tiles(driver, index)
+            if loaded < index:
+                raise TimeoutException(
+                    f"only {loaded} tiles loaded, tile #{index} never appeared"
+                )
+            tile = driver.find_elements(By.CSS_SELECTOR, TILE_SELECTOR)[index - 1]
+
+            # Scroll the product tile into view
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tile)
+
+            # One lookup for all swatch buttons in this tile
+            swatch_buttons = tile.find_elements(By.CSS_SELECTOR, SWATCH_BUTTON_SELECTOR)
+            print(f"Found {len(swatch_buttons)} color swatches")
+
+            # Many retail tiles carry the variant image URL on the swatch
+            # button itself; read them all in one JS call and only run the
+            # click-and-wait cycle for swatches that don't expose one
+            swatch_urls = driver.execute_script(
+                "return Array.from(arguments[0]).map(function (b) {"
+                "  return b.dataset.image || b.getAttribute('data-src') || b.getAttribute('data-href') || null;"
+                "});",
+                swatch_buttons,
+            )
+
+            # The tile's <img> survives swatch swaps (only its src changes),
+            # so resolve it once instead of re-finding it for every swatch
+            img_element = tile.find_element(By.CSS_SELECTOR, TILE_IMG_SELECTOR)
+
+            for swatch_index, (button, preset_url) in enumerate(zip(swatch_buttons, swatch_urls), 1):
+                if preset_url:
+                    # Variant URL already in the markup - no click, no wait.
+                    # The attribute may hold a relative path, so resolve it
+                    # against the listing URL before queueing.
+                    swatch_image_filename = os.path.join(product_folder, f"swatch_{swatch_index}.jpg")
+                    download_tasks.append((urljoin(LISTING_URL, preset_url), swatch_image_filename))
+                    print(f"  ✓ Queued swatch #{swatch_index} for download (pre-resolved)")
+                    continue
+
+                try:
+                    # Capture the current image src so we can detect the swap
+                    old_src = img_element.get_attribute("src")
+
+                    # Click the swatch through JS: one WebDriver command, no
+                    # visibility/clickability dance, and overlays can't
+                    # intercept it (fine for scraping - we want the handler
+                    # to fire, not to emulate a user)
+                    print(f"\n  Clicking swatch #{swatch_index}...")
+                    driver.execute_script("arguments[0].click();", button)
+
+                    # Wait only until the tile image actually updates
+                    try:
+                        WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                            lambda d: img_element.get_attribute("src") != old_src
+                        )
+                    except TimeoutException:
+                        # Some swatches keep the current image (e.g. the
+                        # already-selected color) - carry on with whatever src is set
+                        pass
+
+                    # Extract the updated image
+                    swatch_image_url = _best_src(driver, img_element)
+
+                    if swatch_image_url:
+                        swatch_image_filename = os.path.join(product_folder, f"swatch_{swatch_index}.jpg")
+                        download_tasks.append((swatch_image_url, swatch_image_filename))
+                        print(f"  ✓ Queued swatch #{swatch_index} for download")
+
+                except StaleElementReferenceException:
+                    # The tile re-rendered and detached the cached <img>, but
+                    # the click already fired and the fresh element carries
+                    # the new image - refetch and capture it before moving on
+                    print(f"  ⚠ Image element went stale on swatch #{swatch_index}, refetching")
+                    img_element = tile.find_element(By.CSS_SELECTOR, TILE_IMG_SELECTOR)
+                    swatch_image_url = _best_src(driver, img_element)
+
+                    if swatch_image_url:
+                        swatch_image_filename = os.path.join(product_folder, f"swatch_{swatch_index}.jpg")
+                        download_tasks.append((swatch_image_url, swatch_image_filename))
+                        print(f"  ✓ Queued swatch #{swatch_index} for download")
+                    continue
+                except Exception as e:
+                    print(f"  ✗ Error processing swatch #{swatch_index}: {str(e)}")
+                    continue
+        else:
+            print("No color swatches found for this product")
+
+    except Exception as e:
+        print(f"✗ Error processing swatches for product #{index}: {str(e)}")
+
+    print(f"\n{'='*60}")
+    print(f"Completed Product #{index}: {product_name}")
+    print(f"All files saved in: {product_folder}")
+    print(f"{'='*60}\n")
+
+    return csv_rows, download_tasks
+
 def main():
     # ============================================================
     # CONFIGURATION: Set how many products to scrape
     # ============================================================
     NUMBER_OF_PRODUCTS_TO_SCRAPE = 224  # Change this number to scrape more products
     # ============================================================
-    
+
+    # ===== Phase 1: enumerate tiles with a single driver =====
     driver = setup_driver()
-    wait = WebDriverWait(driver, 15)
-    
+    tiles_data = []
+
     try:
-        # Navigate to the URL
-        url = "https://www.la-z-boy.com/b/living-room-recliners/_/N-musa9i?intpromo=header.Recliner#/b/living-room-recliners/_/N-musa9i?intpromo=header.Recliner&No=213&Nrpp=36&plpaction=loadmore"
-        print(f"Navigating to: {url}")
-        driver.get(url)
-        
-        # Wait for page to load
-        time.sleep(3)
-        
-        # Find all product tiles
+        print(f"Navigating to: {LISTING_URL}")
+        driver.get(LISTING_URL)
+
+        # Wait until the grid holds the configured number of tiles (or stops
+        # growing) - presence of the first batch isn't enough, since the
+        # listing keeps filling via async loadmore
         print("\nSearching for product tiles...")
-        product_tiles = wait.until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, "product-tile"))
-        )
-        total_products_found = len(product_tiles)
+        _wait_for_tiles(driver, NUMBER_OF_PRODUCTS_TO_SCRAPE)
+
+        # Pull every tile's metadata in one JavaScript round-trip; only swatch
+        # clicks still go through WebDriver, inside the pool workers
+        tiles_data = driver.execute_script(EXTRACT_TILES_JS)
+        total_products_found = len(tiles_data)
         print(f"Found {total_products_found} product tiles on the page")
-        
+
         # Determine how many products to process
         products_to_process = min(NUMBER_OF_PRODUCTS_TO_SCRAPE, total_products_found)
+        tiles_data = tiles_data[:products_to_process]
         print(f"Will scrape {products_to_process} product(s) as configured\n")
-        
-        # Process the specified number of product tiles
-        for index, tile in enumerate(product_tiles[:products_to_process], 1):
-            print(f"{'='*60}")
-            print(f"Processing Product #{index}")
-            print(f"{'='*60}")
-            
-            try:
-                # Scroll the product tile into view
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tile)
-                time.sleep(1)
-                
-                # ===== EXTRACT PRODUCT NAME FIRST =====
-                print("\n[EXTRACTING PRODUCT NAME]")
-                try:
-                    product_name_element = tile.find_element(By.CLASS_NAME, "product-name")
-                    product_name = product_name_element.text.strip()
-                    
-                    if not product_name:
-                        product_name = f"Product_{index}"
-                        print(f"⚠ Product name is empty, using default: {product_name}")
-                    else:
-                        print(f"✓ Product Name: {product_name}")
-                    
-                    # Sanitize the product name for folder creation
-                    folder_name = sanitize_folder_name(product_name)
-                    product_folder = os.path.join('scraped_products', folder_name)
-                    
-                    # Create product-specific folder
-                    os.makedirs(product_folder, exist_ok=True)
-                    print(f"✓ Created folder: {product_folder}")
-                    
-                except NoSuchElementException:
-                    print("✗ Could not find product-name element, using default name")
-                    product_name = f"Product_{index}"
-                    folder_name = product_name
-                    product_folder = os.path.join('scraped_products', folder_name)
-                    os.makedirs(product_folder, exist_ok=True)
-                
-                # ===== STEP #01: Extract main image =====
-                print("\n[STEP 1] Extracting main product image...")
-                try:
-                    img_wrapper = tile.find_element(By.CLASS_NAME, "img-wrapper")
-                    img_element = img_wrapper.find_element(By.TAG_NAME, "img")
-                    main_image_url = img_element.get_attribute("src") or img_element.get_attribute("data-src")
-                    
-                    if main_image_url:
-                        main_image_filename = os.path.join(product_folder, "main_image.jpg")
-                        download_image(main_image_url, main_image_filename)
-                    else:
-                        print("✗ Main image URL not found")
-                        
-                except NoSuchElementException:
-                    print("✗ Could not find img-wrapper or image element")
-                
-                # ===== STEP #02: Click color swatches and extract images =====
-                print("\n[STEP 2] Processing color swatches...")
-                try:
-                    # Find all cover swatch buttons
-                    swatch_lists = tile.find_elements(By.CLASS_NAME, "cover-swatch-list")
-                    
-                    if swatch_lists:
-                        # Get all swatch buttons within the swatch lists
-                        swatch_buttons = []
-                        for swatch_list in swatch_lists:
-                            buttons = swatch_list.find_elements(By.TAG_NAME, "button")
-                            swatch_buttons.extend(buttons)
-                        
-                        print(f"Found {len(swatch_buttons)} color swatches")
-                        
-                        for swatch_index, button in enumerate(swatch_buttons, 1):
-                            try:
-                                # Scroll button into view
-                                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                                time.sleep(0.5)
-                                
-                                # Click the swatch button
-                                print(f"\n  Clicking swatch #{swatch_index}...")
-                                try:
-                                    button.click()
-                                except ElementClickInterceptedException:
-                                    # Try JavaScript click if regular click fails
-                                    driver.execute_script("arguments[0].click();", button)
-                                
-                                time.sleep(1.5)  # Wait for image to update
-                                
-                                # Extract the updated image
-                                img_wrapper = tile.find_element(By.CLASS_NAME, "img-wrapper")
-                                img_element = img_wrapper.find_element(By.TAG_NAME, "img")
-                                swatch_image_url = img_element.get_attribute("src") or img_element.get_attribute("data-src")
-                                
-                                if swatch_image_url:
-                                    swatch_image_filename = os.path.join(product_folder, f"swatch_{swatch_index}.jpg")
-                                    download_image(swatch_image_url, swatch_image_filename)
-                                    
-                            except Exception as e:
-                                print(f"  ✗ Error processing swatch #{swatch_index}: {str(e)}")
-                                continue
-                    else:
-                        print("No color swatches found for this product")
-                        
-                except NoSuchElementException:
-                    print("✗ Could not find cover-swatch-list elements")
-                
-                # ===== STEP #03: Extract product details to CSV file =====
-                print("\n[STEP 3] Extracting product details...")
-                try:
-                    # Extract item-detail text
-                    item_detail = tile.find_element(By.CLASS_NAME, "item-detail")
-                    detail_text = item_detail.text
-                    
-                    # Extract item-pricing text
-                    pricing_text = ""
-                    try:
-                        item_pricing = tile.find_element(By.CLASS_NAME, "item-pricing")
-                        pricing_text = item_pricing.text
-                        print(f"✓ Found pricing information")
-                    except NoSuchElementException:
-                        print("⚠ No pricing information found for this product")
-                    
-                    csv_filename = os.path.join(product_folder, "product_details.csv")
-                    
-                    # Parse the detail text into structured data
-                    # Split by lines and create key-value pairs
-                    detail_lines = detail_text.strip().split('\n')
-                    pricing_lines = pricing_text.strip().split('\n') if pricing_text else []
-                    
-                    # Write to CSV
-                    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                        writer = csv.writer(csvfile)
-                        
-                        # Write header
-                        writer.writerow(['Field', 'Value'])
-                        
-                        # Write product name first
-                        writer.writerow(['Product Name', product_name])
-                        
-                        # Write pricing information
-                        if pricing_lines:
-                            writer.writerow(['=== PRICING ===', ''])
-                            for i, line in enumerate(pricing_lines, 1):
-                                line = line.strip()
-                                if line:  # Only write non-empty lines
-                                    # Try to split by colon if it exists (for key: value pairs)
-                                    if ':' in line:
-                                        parts = line.split(':', 1)
-                                        writer.writerow([parts[0].strip(), parts[1].strip()])
-                                    else:
-                                        # If no colon, treat the whole line as a value
-                                        writer.writerow([f'Price {i}', line])
-                        
-                        # Write detail information
-                        writer.writerow(['=== DETAILS ===', ''])
-                        for i, line in enumerate(detail_lines, 1):
-                            line = line.strip()
-                            if line:  # Only write non-empty lines
-                                # Try to split by colon if it exists (for key: value pairs)
-                                if ':' in line:
-                                    parts = line.split(':', 1)
-                                    writer.writerow([parts[0].strip(), parts[1].strip()])
-                                else:
-                                    # If no colon, treat the whole line as a value
-                                    writer.writerow([f'Detail {i}', line])
-                    
-                    print(f"✓ Saved product details to: {csv_filename}")
-                    print(f"\nProduct Details Preview:\n{'-'*40}")
-                    if pricing_text:
-                        print(f"PRICING:\n{pricing_text}\n")
-                    print(f"DETAILS:\n{detail_text[:150] + '...' if len(detail_text) > 150 else detail_text}")
-                    
-                except NoSuchElementException:
-                    print("✗ Could not find item-detail element")
-                
-                print(f"\n{'='*60}")
-                print(f"Completed Product #{index}: {product_name}")
-                print(f"All files saved in: {product_folder}")
-                print(f"{'='*60}\n")
-                
-            except Exception as e:
-                print(f"✗ Error processing product #{index}: {str(e)}")
-                continue
-        
-        print("\n" + "="*60)
-        print("Bot execution completed successfully!")
-        print("="*60)
-        print(f"\nProcessed {products_to_process} product(s)")
-        print(f"All products saved in: ./scraped_products/")
-        print(f"Each product has its own folder named after the product name")
-        print(f"  - main_image.jpg - Main product image")
-        print(f"  - swatch_X.jpg - Color variant images")
-        print(f"  - product_details.csv - Product information in CSV format")
-        
+
     except TimeoutException:
         print("✗ Timeout: Could not load product tiles")
     except Exception as e:
         print(f"✗ An error occurred: {str(e)}")
     finally:
-        # Exit
+        # The enumeration driver is no longer needed; workers own their own
+        # (quit() blocks until Chrome exits, so no pre-sleep is needed)
         print("\nClosing browser...")
-        time.sleep(2)
         driver.quit()
-        print("Browser closed. Exiting.")
+        print("Browser closed.")
+
+    if not tiles_data:
+        print("Nothing to scrape. Exiting.")
+        return
+
+    # Create every product folder in one pre-pass instead of interleaving
+    # mkdir calls with the WebDriver work inside the workers
+    for index, data in enumerate(tiles_data, 1):
+        folder_name = sanitize_folder_name(data['name'] or f"Product_{index}")
+        os.makedirs(os.path.join('scraped_products', folder_name), exist_ok=True)
+
+    # ===== Phase 2: scrape products across a pool of headless Chrome workers =====
+    # Results stream back as workers finish (imap), so each product's rows
+    # land in the combined CSV incrementally instead of waiting for the whole
+    # run. Flushing every CSV_FLUSH_EVERY products bounds what a crash can
+    # lose without paying a flush per row.
+    print(f"\nScraping {len(tiles_data)} product(s) with {SCRAPE_WORKERS} worker processes...")
+    download_tasks = []
+    csv_path = os.path.join('scraped_products', 'all_products.csv')
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(('Product Name', 'Field', 'Value'))
+        with multiprocessing.Pool(SCRAPE_WORKERS, initializer=_init_worker) as pool:
+            products_done = 0
+            for csv_rows, product_tasks in pool.imap(scrape_product, list(enumerate(tiles_data, 1))):
+                writer.writerows(csv_rows)
+                download_tasks.extend(product_tasks)
+                products_done += 1
+                if products_done % CSV_FLUSH_EVERY == 0:
+                    csvfile.flush()
+            # Shut workers down gracefully so their Chrome finalizers run;
+            # leaving it to the with-block means terminate(), which SIGTERMs
+            # idle workers and skips their finalizers
+            pool.close()
+            pool.join()
+    print(f"\n✓ Saved product details to: {csv_path}")
+
+    # ===== Phase 3: download all queued images in parallel =====
+    if download_tasks:
+        session = build_session()
+
+        # Pre-warm the CDN connection so the TLS handshake is done (and any
+        # redirect/cookie dance settled) before the workers pile on
+        try:
+            session.head(download_tasks[0][0], timeout=10)
+        except Exception:
+            pass
+
+        print(f"\nDownloading {len(download_tasks)} image(s) with {DOWNLOAD_WORKERS} workers...")
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            dl_results = list(executor.map(lambda task: download_image(session, *task), download_tasks))
+        print(f"Downloaded {sum(dl_results)} of {len(download_tasks)} image(s)")
+
+    print("\n" + "="*60)
+    print("Bot execution completed successfully!")
+    print("="*60)
+    print(f"\nProcessed {len(tiles_data)} product(s)")
+    print(f"All products saved in: ./scraped_products/")
+    print(f"Each product has its own folder named after the product name")
+    print(f"  - main_image.jpg - Main product image")
+    print(f"  - swatch_X.jpg - Color variant images")
+    print(f"Product information for all products: ./scraped_products/all_products.csv")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()